@@ -8,13 +8,14 @@ import sys
 import warnings
 
 from video_subtitles import __version__
-from video_subtitles.run import run
 from video_subtitles.say import say
 from video_subtitles.settings import Settings
 from video_subtitles.util import MODELS, parse_languages, query_cuda_video_cards
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 
+_MODEL_CHOICES = tuple(MODELS)
+
 settings = Settings()
 
 
@@ -35,7 +36,7 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="Model to use.",
         default="large",
-        choices=MODELS.keys(),
+        choices=_MODEL_CHOICES,
     )
     parser.add_argument(
         "--quite",
@@ -60,8 +61,8 @@ def validate_api_key() -> str | None:
     if not api_key:
         key = input("Enter your Transcribe Anything API key: ")
         settings.set_deepl_key(key)
-        api_key = settings.deepl_key()
         settings.save()
+        api_key = key
     return api_key
 
 
@@ -99,6 +100,10 @@ def main() -> int:
             warnings.warn(
                 "Using free API key. Expect degraded results for large srt files"
             )
+        from video_subtitles.run import (  # pylint: disable=import-outside-toplevel
+            run,
+        )
+
         run(
             file=file,
             deepl_api_key=api_key,
@@ -4,14 +4,16 @@ Gui for the video_subtitles package
 
 # pylint: disable=no-name-in-module,c-extension-no-member,invalid-name,line-too-long
 
+import multiprocessing
 import os
-import platform
-import subprocess
 import sys
-from threading import Thread
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
 
 from PyQt6 import QtCore  # type: ignore
-from PyQt6.QtCore import pyqtSignal  # type: ignore
+from PyQt6.QtCore import QUrl, pyqtSignal  # type: ignore
+from PyQt6.QtGui import QDesktopServices  # type: ignore
 from PyQt6.QtWidgets import (  # type: ignore
     QApplication,
     QComboBox,
@@ -26,29 +28,46 @@ from PyQt6.QtWidgets import (  # type: ignore
     QWidget,
 )
 
-from video_subtitles.run import run
-from video_subtitles.say import say
 from video_subtitles.settings import Settings
-from video_subtitles.thread_processor import ThreadProcessor
 from video_subtitles.util import LANGUAGE_CODES, MODELS, parse_languages
 
 settings = Settings()
 
+_MODEL_NAMES = list(MODELS)
+_SUBTITLE_FORMATS = ["WEBVTT", "SRT"]
+
+
+def _open_url(path):
+    QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+
+# Resolved once, the platform doesn't change while the gui is running.
+if sys.platform == "win32":
+    _open_folder_impl = os.startfile  # pylint: disable=no-member
+else:
+    _open_folder_impl = _open_url
+
 
 def open_folder(path):
     """Opens a folder in the OS."""
-    if platform.system() == "Windows":
-        os.startfile(path)  # pylint: disable=no-member
-    elif platform.system() == "Darwin":
-        subprocess.Popen(["open", path])  # pylint: disable=consider-using-with
-    else:
-        subprocess.Popen(["xdg-open", path])  # pylint: disable=consider-using-with
+    _open_folder_impl(path)
+
+
+class SettingsSnapshot(NamedTuple):
+    """Values written by MainWidget.save_settings."""
+
+    deepl_api_key: str
+    model: str
+    languages: list[str]
+    subtitle_format: str
 
 
 class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
     """Main widget."""
 
     progress_signal = pyqtSignal(bool)
+    job_finished = pyqtSignal(str)
+    job_error = pyqtSignal(str)
 
     def __init__(self, on_drop_callback):  # pylint: disable=too-many-statements
         super().__init__()
@@ -57,6 +76,8 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         self.resize(720, 480)
         self.setAcceptDrops(True)
         self.on_destroy = None
+        self.pending_jobs = 0
+        self.closed = False
 
         deepl_api_key = settings.deepl_key()
 
@@ -90,7 +111,7 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         self.model_label = QLabel(self)
         self.model_label.setText("AI Transcription Model:")
         self.model_select = QComboBox(self)
-        self.model_select.addItems(MODELS.keys())
+        self.model_select.addItems(_MODEL_NAMES)
         self.model_select.setCurrentText(settings.model())
         model_layout.addWidget(self.model_label)
         model_layout.addWidget(self.model_select)
@@ -101,7 +122,7 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         self.subtitle_format = QLabel(self)
         self.subtitle_format.setText("Subtitle Format:")
         self.webvtt_select = QComboBox(self)
-        self.webvtt_select.addItems(["WEBVTT", "SRT"])
+        self.webvtt_select.addItems(_SUBTITLE_FORMATS)
         self.webvtt_select.setCurrentText(settings.subtitle_format())
 
         webvtt_layout.addWidget(self.subtitle_format)
@@ -137,6 +158,8 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         # Create a progress bar
         self.progress_bar = self.create_progress_bar()
         self.progress_signal.connect(self.progress_bar.setVisible)
+        self.job_finished.connect(self.on_job_finished)
+        self.job_error.connect(self.on_job_error)
         progress_bar_layout.addWidget(self.progress_bar)
 
         # Add the header pane and label widget to the main layout
@@ -150,6 +173,7 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
 
     def closeEvent(self, event):
         """Called when the window is closed."""
+        self.closed = True
         if self.on_destroy:
             self.on_destroy()
         super().closeEvent(event)
@@ -173,6 +197,39 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         progress_bar.setVisible(False)  # Hide the progress bar by default
         return progress_bar
 
+    def add_job(self, future: Future) -> None:
+        """Tracks a job so the progress bar stays visible until it completes."""
+        self.pending_jobs += 1
+        self.progress_signal.emit(True)
+        future.add_done_callback(self._emit_job_result)
+
+    def _emit_job_result(self, future: Future) -> None:
+        # Runs on an executor thread, the signals deliver on the gui thread.
+        # Jobs killed on close still report back, by then the widget is gone.
+        if self.closed or future.cancelled():
+            return
+        err = future.exception()
+        if err is not None:
+            self.job_error.emit(str(err))
+            return
+        self.job_finished.emit(future.result())
+
+    def on_job_finished(self, out: str) -> None:
+        """Called on the gui thread when a job has generated its subtitles."""
+        open_folder(out)
+        self._job_done()
+
+    def on_job_error(self, message: str) -> None:
+        """Called on the gui thread when a job has failed."""
+        self._job_done()
+        QMessageBox.critical(self, "Error", message)
+
+    def _job_done(self) -> None:
+        self.pending_jobs -= 1
+        if self.pending_jobs <= 0:
+            self.pending_jobs = 0
+            self.progress_signal.emit(False)
+
     def dragEnterEvent(self, event):
         """Drag and drop handler."""
         if event.mimeData().hasUrls():
@@ -180,111 +237,92 @@ class MainWidget(QMainWindow):  # pylint: disable=too-many-instance-attributes
         else:
             event.ignore()
 
-    def save_settings(self) -> None:
-        """Save the settings."""
+    def save_settings(self) -> SettingsSnapshot:
+        """Save the settings and return the values that were saved.
+
+        Raises ValueError, without saving anything, if the languages are invalid.
+        """
+        languages = parse_languages(self.output_text.text())
         deepl_api_key = self.deepl_input.text().strip()  # get api key from input field
         settings.set_deepl_key(deepl_api_key)  # write api key to settings
         model = self.model_select.currentText().strip()
         settings.set_model(model)
-        languages = self.output_text.text().strip().split(",")
-        languages = [lang.strip() for lang in languages]
         settings.set_languages(languages)
         subtitle_format = self.webvtt_select.currentText().strip()
         settings.set_subtitle_format(subtitle_format)
         settings.save()  # save settings to file
+        return SettingsSnapshot(deepl_api_key, model, languages, subtitle_format)
 
     def dropEvent(self, event):
         """Drag and drop handler."""
-        self.save_settings()
         files = [u.toLocalFile() for u in event.mimeData().urls()]
-        deepl_api_key = self.deepl_input.text().strip()  # get api key from input field
-        model = self.model_select.currentText().strip()
         try:
-            languages = parse_languages(self.output_text.text())
+            snap = self.save_settings()
         except ValueError as ve:
             QMessageBox.critical(self, "Error", str(ve))
             return
+        if not snap.languages:
+            QMessageBox.critical(self, "Error", "No translation outputs given")
+            return
 
-        languages = [lang.strip() for lang in languages]
-        convert_to_webvtt = self.webvtt_select.currentText().strip() == "WEBVTT"
-        for f in files:
-            self.on_drop_callback(
-                f, deepl_api_key, languages, model, convert_to_webvtt
-            )  # pass api key to callback
+        convert_to_webvtt = snap.subtitle_format == "WEBVTT"
+        self.on_drop_callback(
+            files, snap.deepl_api_key, snap.languages, snap.model, convert_to_webvtt
+        )  # pass api key to callback
 
 
 def run_gui() -> None:
     """Runs the gui."""
     app = QApplication(sys.argv)
 
-    thread_processor = ThreadProcessor()
+    # A worker process keeps transcription off the gui process's GIL. Spawn
+    # rather than fork, forking a process with a live QApplication can
+    # deadlock the child. Every job uses the default CUDA device, so run one
+    # at a time rather than stacking models on the same card.
+    mp_context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+
+    def submit(*args) -> Future:
+        nonlocal executor
+        from video_subtitles.run import (  # pylint: disable=import-outside-toplevel
+            generate_subtitles,
+        )
+
+        try:
+            return executor.submit(generate_subtitles, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for running out of memory). Its jobs
+            # were already failed with BrokenProcessPool, so start a new pool.
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+            return executor.submit(generate_subtitles, *args)
+
+    def shutdown() -> None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        # shutdown() leaves a running job alone, kill it so the process doesn't
+        # outlive the window.
+        for child in multiprocessing.active_children():
+            child.terminate()
 
     def callback(
-        videofile: str,
+        videofiles: list[str],
         deepl_api_key: str | None,
         languages: list[str],
         model: str,
         convert_to_webvtt: bool,
     ):
-        # path, _ = os.path.splitext(videofile)
-        # os.makedirs(path, exist_ok=True)
-        # open_folder(path)
         if not deepl_api_key:
             deepl_api_key = None
-
-        # Open folder in the OS
-        def _generate_subtitles(
-            videofile: str,
-            deeply_api_key: str | None,
-            languages: list[str],
-            model: str,
-            convert_to_webvtt: bool,
-        ):
-            # perform the actual work here
-            os.chdir(os.path.dirname(videofile))
-            videofile = os.path.basename(videofile)
-            try:
-                out = run(
-                    file=videofile,
-                    deepl_api_key=deeply_api_key,
-                    out_languages=languages,
-                    model=model,
-                    convert_to_webvtt=convert_to_webvtt,
-                )
-            except Exception as e:  # pylint: disable=broad-except
-                print(e)
-                say("Error: " + str(e))
-                return
-            open_folder(out)
-            print("Generating subtitles for", videofile)
-            voicename = os.path.basename(videofile).split(".")[0].replace("_", " ")
-            fmt = "WEBVTT" if convert_to_webvtt else "SRT"
-            say(
-                f"Attention: {voicename} has completed subtitle generation in {fmt} format"
+        # The whole drop is queued at once, the pool bounds how many run.
+        for videofile in videofiles:
+            future = submit(
+                videofile, deepl_api_key, languages, model, convert_to_webvtt
             )
-
-        thread = Thread(
-            target=_generate_subtitles,
-            args=(videofile, deepl_api_key, languages, model, convert_to_webvtt),
-            daemon=True,
-        )
-        thread_processor.add(thread)
+            gui.add_job(future)
 
     gui = MainWidget(callback)
     gui.show()
-
-    def update_function(val: bool):
-        """Updates the progress bar."""
-        data = update_function.__dict__
-        data["last_value"] = data.get("last_value", False)
-        if val == data["last_value"]:
-            return
-        data["last_value"] = val
-        gui.progress_signal.emit(val)
-
-    gui.on_destroy = thread_processor.stop
-    thread_processor.set_status_callback(update_function)
-    thread_processor.start()
+    gui.on_destroy = shutdown
+    app.aboutToQuit.connect(shutdown)
     sys.exit(app.exec())
 
 
@@ -13,6 +13,7 @@ from appdirs import user_config_dir  # type: ignore
 from disklru import DiskLRUCache  # type: ignore
 
 from video_subtitles.convert_to_webvtt import convert_to_webvtt as convert_webvtt
+from video_subtitles.say import say
 from video_subtitles.translate import srt_wrap, translate
 from video_subtitles.util import read_utf8
 
@@ -41,25 +42,38 @@ def cleanup(file: str):
             print(f"Error removing {file}: {err}")
 
 
-def run(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+def run(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements,too-many-arguments
     file: str,
     deepl_api_key: str | None,
     out_languages: list[str],
     model: str,
     convert_to_webvtt: bool,
+    *,
+    beside_file: bool = False,
 ) -> str:
-    """Run the program."""
+    """Run the program.
+
+    Outputs go to text_<name> in the current working directory, or next to
+    the file itself when beside_file is True.
+    """
     from transcribe_anything.api import (  # pylint: disable=import-outside-toplevel
         transcribe,
     )
     from transcribe_anything.util import get_computing_device  # pylint: disable=import-outside-toplevel
 
-    if file != file.strip():
+    filename = os.path.basename(file)
+    if filename != filename.strip():
         raise RuntimeError(
-            f"File {os.path.basename(file)} cannot contain spaces at the beginning or end"
+            f"File {filename} cannot contain spaces at the beginning or end"
         )
     cache = DiskLRUCache(CACHE_FILE, 16)
     file = os.path.abspath(file)
+    output_dir: str | None = None
+    if beside_file:
+        # Same text_<name>/en layout transcribe_anything generates in the cwd,
+        # it only appends the language folder when it picks the path itself.
+        stem = os.path.splitext(os.path.basename(file))[0]
+        output_dir = os.path.join(os.path.dirname(file), f"text_{stem}", "en")
     print("Running transcription")
     out_languages = out_languages.copy()
     print(f"Output languages: {out_languages}")
@@ -82,7 +96,11 @@ def run(  # pylint: disable=too-many-locals,too-many-branches,too-many-statement
                 f.write(srt_text)
     else:
         out_en_dir = transcribe(
-            url_or_file=file, device=device, model=model, language="en"
+            url_or_file=file,
+            output_dir=output_dir,
+            device=device,
+            model=model,
+            language="en",
         )
         out_en_dir = os.path.abspath(out_en_dir)
         srt_text = read_utf8(os.path.join(out_en_dir, "out.srt"))
@@ -177,3 +195,32 @@ def run(  # pylint: disable=too-many-locals,too-many-branches,too-many-statement
             print(exception)
         raise RuntimeError("Exceptions occurred during translation")
     return outdir
+
+
+def generate_subtitles(
+    videofile: str,
+    deepl_api_key: str | None,
+    languages: list[str],
+    model: str,
+    convert_to_webvtt: bool,
+) -> str:
+    """Generates subtitles in a worker process and returns the output folder."""
+    videofile = os.path.abspath(videofile)
+    try:
+        out = run(
+            file=videofile,
+            deepl_api_key=deepl_api_key,
+            out_languages=languages,
+            model=model,
+            convert_to_webvtt=convert_to_webvtt,
+            beside_file=True,  # don't touch the process-wide cwd
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        print(e)
+        say("Error: " + str(e))
+        raise
+    print("Generating subtitles for", videofile)
+    voicename = os.path.basename(videofile).split(".")[0].replace("_", " ")
+    fmt = "WEBVTT" if convert_to_webvtt else "SRT"
+    say(f"Attention: {voicename} has completed subtitle generation in {fmt} format")
+    return out
@@ -4,6 +4,7 @@ Reads and writes settings to a json file.
 
 import json
 import os
+import threading
 
 from appdirs import user_cache_dir  # type: ignore
 
@@ -20,6 +21,9 @@ def get_settings_path() -> str:
 
 SETTINGS_JSON = get_settings_path()
 
+# Serializes writes so concurrent saves can't interleave and corrupt the file.
+_SAVE_LOCK = threading.Lock()
+
 
 class Settings:
     """Settings class."""
@@ -67,14 +71,20 @@ class Settings:
     def save(self) -> None:
         """Save the settings."""
         # dump json to file
-        with open(SETTINGS_JSON, encoding="utf-8", mode="w") as f:
-            json.dump(self.data, f, indent=4)
+        with _SAVE_LOCK:
+            # The file holds the DeepL key, so keep it readable by the user only.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(SETTINGS_JSON, flags, 0o600)
+            # The mode above only applies to new files, tighten older ones too.
+            os.chmod(SETTINGS_JSON, 0o600)
+            with os.fdopen(fd, encoding="utf-8", mode="w") as f:
+                json.dump(self.data, f, indent=4)
 
     def load(self) -> None:
         """Load the settings."""
-        # load json from file
-        if not os.path.exists(SETTINGS_JSON):
+        # load json from file, a missing file just means default settings
+        try:
+            with open(SETTINGS_JSON, mode="rb") as f:
+                self.data = json.loads(f.read())
+        except FileNotFoundError:
             self.data = {}
-            return
-        with open(SETTINGS_JSON, encoding="utf-8", mode="r") as f:
-            self.data = json.load(f)
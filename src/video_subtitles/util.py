@@ -2,14 +2,13 @@
 
 # pylint: disable=line-too-long
 
+import argparse
 import os
 import subprocess
 import tempfile
 from dataclasses import dataclass
 from shutil import which
 
-from download import download  # type: ignore
-
 INSTALL_TRANSCRIBE_ANYTHING_CUDA = (
     "https://raw.githubusercontent.com/zackees/transcribe-anything/main/install_cuda.py"
 )
@@ -70,6 +69,8 @@ def ensure_transcribe_anything_installed() -> None:
         return
     except Exception:  # pylint: disable=broad-except
         print("transcribe_anything is not installed, installing now...")
+        from download import download  # type: ignore  # pylint: disable=import-outside-toplevel
+
         with tempfile.TemporaryDirectory() as tempdir:
             download(
                 INSTALL_TRANSCRIBE_ANYTHING_CUDA,
@@ -82,13 +83,17 @@ def ensure_transcribe_anything_installed() -> None:
                 )  # pylint: disable=raise-missing-from
 
 
+class UnknownLanguageError(argparse.ArgumentTypeError, ValueError):
+    """Unknown language codes, argparse shows the message to the user as is."""
+
+
 def parse_languages(languages_str: str) -> list[str]:
     """Parse a comma-separated list of languages and return a list of language codes."""
-    languages = languages_str.split(",")
-    languages = [language.strip().lower() for language in languages]
-    for language in languages:
-        if language not in LANGUAGE_CODES:
-            raise ValueError(f"Unknown language: {language}")
+    languages = [lang.strip().lower() for lang in languages_str.split(",")]
+    languages = [lang for lang in languages if lang]
+    unknown = set(languages).difference(LANGUAGE_CODES_SET)
+    if unknown:
+        raise UnknownLanguageError(f"Unknown language(s): {', '.join(sorted(unknown))}")
     return languages
 
 
@@ -127,6 +132,8 @@ LANGUAGE_CODES = {
     "zh": "Chinese (simplified)",
 }
 
+LANGUAGE_CODES_SET = frozenset(LANGUAGE_CODES)
+
 MODELS = {
     # Maps model name to number of GPU memory (in gigabytes) required.
     "tiny": 1.0,
@@ -0,0 +1,39 @@
+"""
+Unit test file.
+"""
+
+import argparse
+import unittest
+
+from video_subtitles.util import parse_languages
+
+
+class ParseLanguagesTester(unittest.TestCase):
+    """Tests parsing of the comma-separated language list."""
+
+    def test_normalizes_codes(self) -> None:
+        """Codes are stripped and lower-cased, empty entries are dropped."""
+        self.assertEqual(["es", "fr", "zh"], parse_languages(" es, FR,zh,"))
+
+    def test_empty_input(self) -> None:
+        """Empty input parses to no languages, callers reject it."""
+        self.assertEqual([], parse_languages(""))
+        self.assertEqual([], parse_languages(" , "))
+
+    def test_reports_all_unknown_codes(self) -> None:
+        """Every unknown code is listed in a single error."""
+        with self.assertRaises(ValueError) as ctx:
+            parse_languages("yy,es,xx")
+        self.assertIn("xx, yy", str(ctx.exception))
+
+    def test_argparse_shows_message(self) -> None:
+        """argparse reports the aggregated message instead of a generic one."""
+        parser = argparse.ArgumentParser(exit_on_error=False)
+        parser.add_argument("--languages", type=parse_languages)
+        with self.assertRaises(argparse.ArgumentError) as ctx:
+            parser.parse_args(["--languages", "xx,yy"])
+        self.assertIn("Unknown language(s): xx, yy", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
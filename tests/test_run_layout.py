@@ -0,0 +1,100 @@
+"""
+Unit test file.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from video_subtitles import run as run_module
+
+
+def _fake_transcribe(
+    url_or_file, output_dir=None, device=None, model=None, language=None
+):
+    """Mimics where transcribe_anything writes out.srt."""
+    del device, model
+    if output_dir is None:
+        stem = os.path.splitext(os.path.basename(url_or_file))[0]
+        output_dir = os.path.join(f"text_{stem}", language)
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "out.srt"), encoding="utf-8", mode="w") as f:
+        f.write("1\n00:00:00,000 --> 00:00:01,000\nHello\n")
+    return output_dir
+
+
+def _fake_translate(api_key, in_srt, out_srt, from_lang, to_lang):
+    """Copies the source srt instead of translating it."""
+    del api_key, from_lang, to_lang
+    shutil.copy(in_srt, out_srt)
+
+
+def _fake_transcribe_anything() -> dict[str, types.ModuleType]:
+    """Stand-in transcribe_anything modules for patching sys.modules."""
+    api = types.ModuleType("transcribe_anything.api")
+    api.transcribe = _fake_transcribe  # type: ignore
+    util = types.ModuleType("transcribe_anything.util")
+    util.get_computing_device = lambda: "cpu"  # type: ignore
+    return {
+        "transcribe_anything": types.ModuleType("transcribe_anything"),
+        "transcribe_anything.api": api,
+        "transcribe_anything.util": util,
+    }
+
+
+class RunLayoutTester(unittest.TestCase):
+    """Checks the output layout of run() when writing beside the file."""
+
+    def test_beside_file_layout(self) -> None:
+        """Outputs land in text_<stem> and the video folder is untouched."""
+        modules = _fake_transcribe_anything()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            videodir = os.path.join(tmpdir, "videos")
+            os.makedirs(videodir)
+            videofile = os.path.join(videodir, "video.mp4")
+            unrelated_srt = os.path.join(videodir, "other.srt")
+            for path in (videofile, unrelated_srt):
+                with open(path, encoding="utf-8", mode="w") as f:
+                    f.write("keep me")
+            with mock.patch.dict(sys.modules, modules), mock.patch.object(
+                run_module, "CACHE_FILE", os.path.join(tmpdir, "cache.db")
+            ), mock.patch.object(
+                run_module, "translate", _fake_translate
+            ), mock.patch.object(
+                run_module, "srt_wrap", lambda _: None
+            ):
+                out = run_module.run(
+                    file=videofile,
+                    deepl_api_key=None,
+                    out_languages=["es"],
+                    model="small",
+                    convert_to_webvtt=False,
+                    beside_file=True,
+                )
+            outdir = os.path.join(videodir, "text_video")
+            self.assertEqual(outdir, out)
+            self.assertEqual(["en.srt", "es.srt"], sorted(os.listdir(outdir)))
+            self.assertEqual(
+                ["other.srt", "text_video", "video.mp4"], sorted(os.listdir(videodir))
+            )
+
+    def test_rejects_padded_file_name(self) -> None:
+        """Leading spaces in the file name are rejected for absolute paths too."""
+        modules = _fake_transcribe_anything()
+        with mock.patch.dict(sys.modules, modules), self.assertRaises(RuntimeError):
+            run_module.run(
+                file=os.path.abspath(os.path.join("videos", " video.mp4")),
+                deepl_api_key=None,
+                out_languages=["es"],
+                model="small",
+                convert_to_webvtt=False,
+                beside_file=True,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()